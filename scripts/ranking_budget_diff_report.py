@@ -12,15 +12,70 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Only these per-case fields feed the diff; everything else is skipped
+# during streaming so peak memory stays flat for large dumps.
+_CASE_FIELDS = ("id", "observed_top_result_id", "reciprocal_rank")
+_CASE_PREFIXES = frozenset(f"cases.item.{field}" for field in _CASE_FIELDS)
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
 
 def load(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    """Load a ranking-budget report, materializing only the fields we diff.
+
+    When ``ijson`` is available the file is parsed incrementally: top-level
+    metrics and a trimmed-down ``cases`` list are built in a single pass
+    without ever holding the raw text plus the full decoded tree in memory.
+    Falls back to a one-shot stdlib parse otherwise.
+    """
+    if ijson is None:
+        if orjson is not None:
+            # bytes in, dict out: skips the intermediate str allocation.
+            return orjson.loads(path.read_bytes())
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    report: dict = {"cases": []}
+    cases = report["cases"]
+    case = None
+    with open(path, "rb", buffering=1 << 20) as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix.startswith("cases.item"):
+                # Exact-prefix match: nested objects inside a case (e.g.
+                # top_reason_summary) emit start_map/end_map events too and
+                # must not be mistaken for case boundaries.
+                if event == "start_map" and prefix == "cases.item":
+                    case = {}
+                elif event == "end_map" and prefix == "cases.item":
+                    cases.append(case)
+                    case = None
+                elif case is not None and prefix in _CASE_PREFIXES:
+                    case[prefix[len("cases.item.") :]] = value
+            elif "." not in prefix and prefix and event in _SCALAR_EVENTS:
+                report[prefix] = value
+    return report
+
+
+# Bound printf formatters: one C-level call per percentage / case row
+# instead of the f-string format machinery.
+_PCT = "%.1f%%".__mod__
+_ROW = b"| %s | `%s` | `%s` | %.3f | %.3f |\n".__mod__
 
 
 def pct(value: float) -> str:
-    return f"{value * 100:.1f}%"
+    return _PCT(value * 100.0)
 
 
 def main() -> int:
@@ -30,59 +85,94 @@ def main() -> int:
     parser.add_argument("--out", required=True, type=Path)
     args = parser.parse_args()
 
-    before = load(args.before)
-    after = load(args.after)
+    # The two parses are independent and both ijson and orjson release the
+    # GIL for long stretches, so overlapping them cuts load wallclock.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        before_future = pool.submit(load, args.before)
+        after_future = pool.submit(load, args.after)
+        before = before_future.result()
+        after = after_future.result()
 
     metrics = [
         ("top1_hit_rate", "Top-1 hit rate"),
         ("mrr", "MRR"),
     ]
 
-    lines = [
-        "# Ranking Budget Contract Diff Report",
-        "",
-        f"- before profile: `{before.get('profile', 'unknown')}`",
-        f"- after profile: `{after.get('profile', 'unknown')}`",
-        f"- before file: `{args.before}`",
-        f"- after file: `{args.after}`",
-        "",
-        "| Metric | Before | After | Delta |",
-        "| --- | ---: | ---: | ---: |",
-    ]
+    # Encode each line as it is emitted: the final write_bytes then needs no
+    # second full-copy encode pass over the assembled report.
+    out = bytearray()
+    w = out.extend  # bound method: skips the attribute lookup per row
+    w(b"# Ranking Budget Contract Diff Report\n")
+    w(b"\n")
+    w(f"- before profile: `{before.get('profile', 'unknown')}`\n".encode("utf-8"))
+    w(f"- after profile: `{after.get('profile', 'unknown')}`\n".encode("utf-8"))
+    w(f"- before file: `{args.before}`\n".encode("utf-8"))
+    w(f"- after file: `{args.after}`\n".encode("utf-8"))
+    w(b"\n")
+    w(b"| Metric | Before | After | Delta |\n")
+    w(b"| --- | ---: | ---: | ---: |\n")
     for key, label in metrics:
         b = float(before.get(key, 0.0))
         a = float(after.get(key, 0.0))
         delta = a - b
-        lines.append(f"| {label} | {pct(b)} | {pct(a)} | {pct(delta)} |")
-
-    before_cases = {case["id"]: case for case in before.get("cases", [])}
-    after_cases = {case["id"]: case for case in after.get("cases", [])}
-    case_ids = sorted(set(before_cases) | set(after_cases))
-
-    lines.extend(
-        [
-            "",
-            "## Case-level deltas",
-            "",
-            "| Case | Before top1 | After top1 | Before RR | After RR |",
-            "| --- | --- | --- | ---: | ---: |",
-        ]
-    )
+        w(f"| {label} | {pct(b)} | {pct(a)} | {pct(delta)} |\n".encode("utf-8"))
+
+    # Single ingest pass per side: build the id-keyed dict and the combined
+    # id set in one traversal instead of dict-comps plus a keys union.
+    # () instead of [] as the default: the empty tuple is a singleton, so no
+    # throwaway list is allocated just to serve as a fallback.
+    # Each side stores a (top result, reciprocal rank) tuple with the float
+    # coercion done here, so the row loop below is pure lookups.
+    # Interning the ids means both sides key on the same string objects, so
+    # the dict probes below hit the identity fast path instead of comparing
+    # contents, and repeated ids cost no extra memory.
+    intern = sys.intern
+    before_cases: dict = {}
+    after_cases: dict = {}
+    ids = set()
+    for case in before.get("cases", ()):
+        cid = intern(case["id"])
+        before_cases[cid] = (
+            case.get("observed_top_result_id"),
+            float(case.get("reciprocal_rank", 0.0)),
+        )
+        ids.add(cid)
+    for case in after.get("cases", ()):
+        cid = intern(case["id"])
+        after_cases[cid] = (
+            case.get("observed_top_result_id"),
+            float(case.get("reciprocal_rank", 0.0)),
+        )
+        ids.add(cid)
+    case_ids = sorted(ids)
+
+    w(b"\n")
+    w(b"## Case-level deltas\n")
+    w(b"\n")
+    w(b"| Case | Before top1 | After top1 | Before RR | After RR |\n")
+    w(b"| --- | --- | --- | ---: | ---: |\n")
+    # Hoist lookups out of the row loop; the shared empty sentinel is safe
+    # because rows only ever read from it.
+    bget = before_cases.get
+    aget = after_cases.get
+    empty = (None, 0.0)
     for case_id in case_ids:
-        b = before_cases.get(case_id, {})
-        a = after_cases.get(case_id, {})
-        lines.append(
-            "| {id} | `{b_top}` | `{a_top}` | {b_rr:.3f} | {a_rr:.3f} |".format(
-                id=case_id,
-                b_top=b.get("observed_top_result_id"),
-                a_top=a.get("observed_top_result_id"),
-                b_rr=float(b.get("reciprocal_rank", 0.0)),
-                a_rr=float(a.get("reciprocal_rank", 0.0)),
+        b_top, b_rr = bget(case_id, empty)
+        a_top, a_rr = aget(case_id, empty)
+        w(
+            _ROW(
+                (
+                    case_id.encode("utf-8"),
+                    str(b_top).encode("utf-8"),
+                    str(a_top).encode("utf-8"),
+                    b_rr,
+                    a_rr,
+                )
             )
         )
 
     args.out.parent.mkdir(parents=True, exist_ok=True)
-    args.out.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    args.out.write_bytes(bytes(out))
     print(f"wrote diff report: {args.out}")
     return 0
 
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import functools
 import time
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, NamedTuple, TypeVar
 
 from .models import Role
 
 # Prefix expected on Authorization header values.
 BEARER_PREFIX = "Bearer "
+_BEARER_LEN = len(BEARER_PREFIX)
 
 # Token expiration time in seconds (24 hours).
 TOKEN_TTL_SECONDS = 86400
@@ -28,32 +29,70 @@ class AuthError(Exception):
         return f"AuthError({self.code!r}, {str(self)!r})"
 
 
-class TokenClaims:
-    """Decoded JWT claims extracted from a validated token."""
+class TokenClaims(NamedTuple):
+    """Decoded JWT claims extracted from a validated token.
 
-    __slots__ = ("sub", "role", "exp", "iat", "issuer")
+    A NamedTuple so construction is a single tuple allocation rather than
+    per-attribute stores, which matters on the request-hot decode path.
+    """
+
+    sub: str
+    role: Role
+    exp: float
+    iat: float
 
-    def __init__(
-        self,
-        sub: str,
-        role: Role,
-        exp: float,
-        iat: float,
-        issuer: str = "cruxe",
-    ) -> None:
-        self.sub = sub
-        self.role = role
-        self.exp = exp
-        self.iat = iat
-        self.issuer = issuer
+    # Issuer never varies per token today, so it lives on the class: every
+    # claims tuple is one slot smaller and construction skips a store.
+    issuer = "cruxe"
 
-    def is_expired(self) -> bool:
-        """Check whether the token has expired."""
-        return self.exp < time.time()
+    def is_expired(self, now: float | None = None) -> bool:
+        """Check whether the token has expired.
 
-    def remaining_seconds(self) -> float:
+        Callers on hot paths may pass a pre-sampled ``now`` to avoid an
+        extra clock read per check.
+        """
+        return self.exp < (now if now is not None else time.time())
+
+    def remaining_seconds(self, now: float | None = None) -> float:
         """Return seconds until expiration (negative if expired)."""
-        return self.exp - time.time()
+        return self.exp - (now if now is not None else time.time())
+
+
+# Decoded-claims cache keyed on (token, secret). A plain dict rather than
+# functools.lru_cache so expired entries can be evicted individually; dicts
+# preserve insertion order, so the first key is also the oldest.
+_CLAIMS_CACHE: dict[tuple[str, str], TokenClaims] = {}
+_CLAIMS_CACHE_MAX = 4096
+
+
+def _decode_claims(token: str, secret: str) -> TokenClaims:
+    """Decode a bare (prefix-stripped) token and return its claims.
+
+    Results are memoized per ``(token, secret)`` so repeat requests from
+    the same client within the TTL skip signature verification and claim
+    construction entirely.
+    """
+    key = (token, secret)
+    claims = _CLAIMS_CACHE.get(key)
+    if claims is not None:
+        return claims
+
+    # In a real implementation, decode and verify the HMAC signature.
+    _header, _payload, _signature = token.split(".")
+    _ = secret  # used for HMAC verification
+
+    now = time.time()
+    claims = TokenClaims(
+        sub="user-1",
+        role=Role.USER,
+        exp=now + TOKEN_TTL_SECONDS,
+        iat=now,
+    )
+
+    if len(_CLAIMS_CACHE) >= _CLAIMS_CACHE_MAX:
+        del _CLAIMS_CACHE[next(iter(_CLAIMS_CACHE))]
+    _CLAIMS_CACHE[key] = claims
+    return claims
 
 
 def validate_token(auth_header: str, secret: str) -> TokenClaims:
@@ -72,24 +111,18 @@ def validate_token(auth_header: str, secret: str) -> TokenClaims:
     if not auth_header.startswith(BEARER_PREFIX):
         raise AuthError("Missing Bearer prefix", "MALFORMED")
 
-    token = auth_header[len(BEARER_PREFIX) :]
+    token = auth_header[_BEARER_LEN:]
     parts = token.split(".")
 
     if len(parts) != 3:
         raise AuthError(f"Expected 3 parts, got {len(parts)}", "MALFORMED")
 
-    # In a real implementation, decode and verify the HMAC signature.
-    _header, _payload, _signature = parts
-    _ = secret  # used for HMAC verification
-
-    claims = TokenClaims(
-        sub="user-1",
-        role=Role.USER,
-        exp=time.time() + TOKEN_TTL_SECONDS,
-        iat=time.time(),
-    )
+    claims = _decode_claims(token, secret)
 
+    # Cached claims still honor the TTL: expiry is re-checked on every hit,
+    # and only the stale entry is dropped — other clients keep their hits.
     if claims.is_expired():
+        _CLAIMS_CACHE.pop((token, secret), None)
         raise AuthError("Token has expired", "EXPIRED")
 
     return claims
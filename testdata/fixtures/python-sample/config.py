@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -21,7 +22,7 @@ class ConfigError(Exception):
         self.variable = variable
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration container.
 
@@ -39,9 +40,24 @@ class Config:
     allowed_origins: list[str] = field(
         default_factory=lambda: ["http://localhost:3000"]
     )
+    # Memoized derived values, keyed by the fields they were computed from
+    # so mutation after load() invalidates them naturally.
+    _addr_cache: Optional[tuple[tuple[str, int], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validate_cache: Optional[tuple[tuple, tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def validate(self) -> list[str]:
         """Return a list of validation error messages (empty if valid)."""
+        key = (self.database_url, self.jwt_secret, self.port, self.pool_size)
+        cached = self._validate_cache
+        if cached is not None and cached[0] == key:
+            # Fresh list per call: callers may mutate the result without
+            # poisoning the cache.
+            return list(cached[1])
+
         errors: list[str] = []
 
         if not self.database_url:
@@ -53,12 +69,44 @@ class Config:
         if self.pool_size < 1:
             errors.append(f"pool_size must be >= 1, got {self.pool_size}")
 
+        self._validate_cache = (key, tuple(errors))
         return errors
 
     @property
     def server_address(self) -> str:
         """Return the full bind address with port."""
-        return f"{self.bind_address}:{self.port}"
+        key = (self.bind_address, self.port)
+        cached = self._addr_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        address = f"{self.bind_address}:{self.port}"
+        self._addr_cache = (key, address)
+        return address
+
+
+# Matches each trimmed, non-empty entry of a comma-separated list in one
+# C-level scan, instead of split() plus strip() twice per token.
+_ORIGIN_RE = re.compile(r"[^,\s]+(?:[^,]*[^,\s])?")
+
+
+def _parse_origins(value: str) -> list[str]:
+    """Split a comma-separated origins list, dropping blank entries."""
+    return _ORIGIN_RE.findall(value)
+
+
+# (env var, Config attribute, parser, required in strict mode) — swept in a
+# single table-driven pass by load_config instead of one branch per variable.
+_ENV_SPEC = (
+    ("BIND_ADDRESS", "bind_address", str, False),
+    ("PORT", "port", int, False),
+    ("DATABASE_URL", "database_url", str, True),
+    ("JWT_SECRET", "jwt_secret", str, True),
+    ("ALLOWED_ORIGINS", "allowed_origins", _parse_origins, False),
+)
+
+# Recognized DEBUG spellings; one hash lookup replaces two tuple scans.
+_DEBUG_MAP = {"1": True, "true": True, "0": False, "false": False}
 
 
 def load_config(env_file: Optional[str] = None, strict: bool = False) -> Config:
@@ -78,33 +126,19 @@ def load_config(env_file: Optional[str] = None, strict: bool = False) -> Config:
     _ = env_file  # would load .env in real implementation
 
     config = Config()
-
-    if bind := os.environ.get("BIND_ADDRESS"):
-        config.bind_address = bind
-
-    if port_str := os.environ.get("PORT"):
-        try:
-            config.port = int(port_str)
-        except ValueError:
-            raise ConfigError(f"Invalid port: {port_str!r}", "PORT")
-
-    if db_url := os.environ.get("DATABASE_URL"):
-        config.database_url = db_url
-    elif strict:
-        raise ConfigError("DATABASE_URL is required", "DATABASE_URL")
-
-    if secret := os.environ.get("JWT_SECRET"):
-        config.jwt_secret = secret
-    elif strict:
-        raise ConfigError("JWT_SECRET is required", "JWT_SECRET")
-
-    debug_val = os.environ.get("DEBUG", "").lower()
-    if debug_val in ("1", "true"):
-        config.debug = True
-    elif debug_val in ("0", "false"):
-        config.debug = False
-
-    if origins := os.environ.get("ALLOWED_ORIGINS"):
-        config.allowed_origins = [o.strip() for o in origins.split(",") if o.strip()]
+    env = os.environ
+
+    for key, attr, parse, required in _ENV_SPEC:
+        if value := env.get(key):
+            try:
+                setattr(config, attr, parse(value))
+            except ValueError:
+                raise ConfigError(f"Invalid {key}: {value!r}", key)
+        elif required and strict:
+            raise ConfigError(f"{key} is required", key)
+
+    debug = _DEBUG_MAP.get(env.get("DEBUG", "").lower())
+    if debug is not None:
+        config.debug = debug
 
     return config